@@ -7,6 +7,8 @@ apollon/_defaults.py --  Defaut definitions
 """
 import pathlib
 
+import numpy as np
+
 from . import APOLLON_PATH
 
 
@@ -17,6 +19,8 @@ DATE_TIME = '%Y-%m-%d %H:%M:%S'
 
 SPL_REF = 2e-5
 
+FLOAT64_EPS = np.finfo('float64').eps
+
 PP_SIGNAL = {'linewidth': 1, 'linestyle': 'solid', 'color': 'k', 'alpha': .5,
              'zorder': 0}
 
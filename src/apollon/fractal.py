@@ -12,10 +12,12 @@ Function:
 from typing import Tuple
 
 import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
 from scipy import stats
 from scipy.spatial import distance
 
 from . types import Array
+from . import _defaults
 
 
 def log_histogram_bin_edges(dists, n_bins: int, default: float = None):
@@ -33,7 +35,7 @@ def log_histogram_bin_edges(dists, n_bins: int, default: float = None):
             lower_bound = next(sd_it)
 
     if lower_bound == 0:
-        lower_bound = np.finfo('float64').eps
+        lower_bound = _defaults.FLOAT64_EPS
 
     return np.geomspace(lower_bound, dists.max(), n_bins+1)
 
@@ -45,20 +47,21 @@ def delay_embedding(inp: Array, delay: int, m_dim: int) -> Array:
     This method makes a hard cut at the upper bound of `inp` and
     does not perform zero padding to match the input size.
 
+    If `inp` has more than one dimension, each vector along the last
+    axis is embedded separately. Hence, a batch of segments of shape
+    (n_segs, n_perseg) results in an array of shape (n_segs, n_vects, m_dim).
+
     Params:
-        inp:   One-dimensional input vector.
+        inp:   Input array.
         delay: Vector delay in samples.
         m_dim: Number of embedding dimension.
 
     Returns:
-        Two-dimensional delay embedding array in which the nth row
+        Read-only delay embedding view of `inp` in which the nth row
         represents the  n * `delay` samples delayed vector.
     """
-    max_idx = inp.size - ((m_dim-1)*delay)
-    emb_vects = np.empty((max_idx, m_dim))
-    for i in range(max_idx):
-        emb_vects[i] = inp[i:i+m_dim*delay:delay]
-    return emb_vects
+    win_len = (m_dim-1) * delay + 1
+    return sliding_window_view(inp, win_len, axis=-1)[..., ::delay]
 
 
 def embedding_dists(inp: Array, delay: int, m_dim: int,
@@ -96,6 +99,57 @@ def embedding_entropy(emb: Array, n_bins: int) -> Array:
     return stats.entropy(counts.flatten())
 
 
+def batch_embedding_entropy(embs: Array, n_bins: int,
+                            n_block: int = 128) -> Array:
+    """Compute the information entropy of each embedding in a batch.
+
+    This is the vectorized counterpart of ``embedding_entropy``. Each
+    embedding is binned into ``n_bins`` equidistant boxes per dimension,
+    spanning the range of the embedding along that dimension.
+
+    Embeddings are processed in blocks of ``n_block``, which bounds the
+    size of intermediate arrays independently of the batch size.
+
+    Params:
+        embs:     Three-dimensional array of shape (n_embs, n_vects, m_dim).
+        n_bins:   Number of bins per dimension.
+        n_block:  Number of embeddings processed at once.
+
+    Returns:
+        One-dimensional array of entropies.
+    """
+    out = np.empty(embs.shape[0])
+    for start in range(0, embs.shape[0], n_block):
+        stop = start + n_block
+        out[start:stop] = _block_embedding_entropy(embs[start:stop], n_bins)
+    return out
+
+
+def _block_embedding_entropy(embs: Array, n_bins: int) -> Array:
+    """Compute the entropy of each embedding in ``embs`` at once."""
+    n_embs, n_vects, m_dim = embs.shape
+    lower = embs.min(axis=1, keepdims=True)
+    width = embs.max(axis=1, keepdims=True) - lower
+    width[width == 0] = 1.0
+    step = width / n_bins
+
+    # Correct rounding errors such that bins match ``np.histogramdd``.
+    idx = ((embs - lower) / step).astype(np.int64)
+    np.clip(idx, 0, n_bins-1, out=idx)
+    idx -= embs < idx * step + lower
+    idx += (embs >= (idx+1) * step + lower) & (idx < n_bins-1)
+    box_ids = np.sort(idx @ (n_bins ** np.arange(m_dim, dtype=np.int64)),
+                      axis=1)
+
+    # Count occupied boxes as runs of equal ids in each sorted row.
+    is_new = np.ones(box_ids.shape, dtype=bool)
+    is_new[:, 1:] = box_ids[:, 1:] != box_ids[:, :-1]
+    starts = np.flatnonzero(is_new)
+    probs = np.diff(np.append(starts, box_ids.size)) / n_vects
+    return -np.bincount(starts // n_vects, weights=probs*np.log(probs),
+                        minlength=n_embs)
+
+
 def __lorenz_system(x, y, z, s, r, b):
     """Compute the derivatives of the Lorenz system of coupled
        differential equations.
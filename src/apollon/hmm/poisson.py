@@ -100,6 +100,22 @@ class PoissonHmm:
     def score(self, X: _Array):
         """Compute the log-likelihood of `X` under this HMM."""
 
+    def save_params(self, path: _at.PathType) -> None:
+        """Save estimated parameters only.
+
+        The arrays ``lambda_``, ``gamma_``, and ``delta_`` are written to a
+        compressed numpy zip archive, which avoids pickling.
+
+        Args:
+            path:  File path.
+
+        Raises:
+            ValueError:  If the model has not been fitted.
+        """
+        if self.params is None:
+            raise ValueError('Model has not been fitted. Call ``fit()`` first.')
+        aio.save_to_npz(self.params.__dict__, path)
+
     def to_dict(self):
         """Returns HMM parameters as dict."""
         attrs = ('hyper_params', 'init_params', 'params',
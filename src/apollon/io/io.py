@@ -10,20 +10,33 @@ Functions:
     array_print_opt         Set format for printing numpy arrays.
     files_in_folder         Iterate over all files in given folder.
     generate_outpath        Compute path for feature output.
+    load_from_npy           Load data from numpy binary format.
+    load_from_npz           Load arrays from numpy zip archive.
     load_from_pickle        Load pickled data.
     repath                  Change path but keep file name.
+    save_to_npy             Save an array to numpy binary format.
+    save_to_npz             Save multiple arrays to numpy zip archive.
     save_to_pickle          Pickle some data.
 """
 from contextlib import contextmanager as _contextmanager
+import os
 import pathlib
 import pickle
-from typing import Any, Optional
+from typing import Any, Dict, Optional, Tuple
 
 import numpy as np
 
 from .. types import Array, PathType
 from . json import ArrayEncoder
 
+
+def _as_path(path: PathType) -> pathlib.Path:
+    """Return ``path`` as ``pathlib.Path``, without copying existing paths."""
+    if isinstance(path, pathlib.Path):
+        return path
+    return pathlib.Path(path)
+
+
 def generate_outpath(in_path: PathType,
                      out_path: Optional[PathType],
                      suffix: str = None) -> PathType:
@@ -40,22 +53,43 @@ def generate_outpath(in_path: PathType,
     Returns:
         Valid output path.
     """
-    in_path = pathlib.Path(in_path)
-    if suffix is None:
-        default_fname = '{}'.format(in_path.stem)
-    else:
-        default_fname = '{}.{}'.format(in_path.stem, suffix)
+    default_fname, _ = _split_ext(in_path)
+    if suffix is not None:
+        default_fname = '{}.{}'.format(default_fname, suffix)
 
     if out_path is None:
-        out_path = pathlib.Path(default_fname)
-    else:
-        out_path = pathlib.Path(out_path)
-        if not out_path.suffix:
-            out_path = out_path.joinpath(default_fname)
-        if not out_path.parent.is_dir():
-            msg = f'Error. Path "{out_path.parent!s}" does not exist.'
-            raise ValueError(msg)
-    return out_path
+        return pathlib.Path(default_fname)
+
+    out_path = _strip_sep(os.fspath(out_path))
+    if not _split_ext(out_path)[1]:
+        out_path = os.path.join(out_path, default_fname)
+    parent = os.path.dirname(out_path) or os.curdir
+    if not os.path.isdir(parent):
+        msg = f'Error. Path "{parent!s}" does not exist.'
+        raise ValueError(msg)
+    return pathlib.Path(out_path)
+
+
+def _strip_sep(path: str) -> str:
+    """Remove trailing separators and ``.`` components like ``pathlib``."""
+    seps = os.sep + (os.altsep or '')
+    stripped = path.rstrip(seps)
+    while stripped.endswith(tuple(sep + '.' for sep in seps)):
+        stripped = stripped[:-2].rstrip(seps)
+    return stripped or path
+
+
+def _split_ext(path: PathType) -> Tuple[str, str]:
+    """Split the final component of ``path`` into stem and suffix.
+
+    Follows ``pathlib.PurePath``: the suffix is empty for names that
+    start or end with a dot.
+    """
+    name = os.path.basename(_strip_sep(os.fspath(path)))
+    idx = name.rfind('.')
+    if 0 < idx < len(name) - 1:
+        return name[:idx], name[idx:]
+    return name, ''
 
 class PoissonHmmEncoder(ArrayEncoder):
     """JSON encoder for PoissonHmm.
@@ -88,22 +122,33 @@ class WavFileAccessControl:
     This assures that the path indeed points to a file, which has to be a .wav file. Otherwise
     an error is raised. The path to the file is saved as absolute path and the attribute is
     read-only.
+
+    The path is stored in the owning instance's ``__dict__``, so it is released
+    together with the instance.
     """
 
     def __init__(self):
         """Hi there!"""
-        self.__attribute = {}
+        self._name = '_wav_file'
+
+    def __set_name__(self, owner, name):
+        self._name = '_wav_' + name
 
-    def __get__(self, obj, objtype):
-        return self.__attribute[obj]
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        try:
+            return obj.__dict__[self._name]
+        except KeyError:
+            raise AttributeError('File name has not been set.') from None
 
     def __set__(self, obj, file_name):
-        if obj not in self.__attribute.keys():
+        if self._name not in obj.__dict__:
             _path = pathlib.Path(file_name).resolve()
             if _path.exists():
                 if _path.is_file():
                     if _path.suffix == '.wav':
-                        self.__attribute[obj] = _path
+                        obj.__dict__[self._name] = _path
                     else:
                         raise IOError('`{}` is not a .wav file.'
                                       .format(file_name))
@@ -116,7 +161,7 @@ class WavFileAccessControl:
             raise AttributeError('File name cannot be changed.')
 
     def __delete__(self, obj):
-        del self.__attribute[obj]
+        del obj.__dict__[self._name]
 
 
 @_contextmanager
@@ -144,7 +189,7 @@ def load_from_pickle(path: PathType) -> Any:
     Returns:
         Unpickled object
     """
-    path = pathlib.Path(path)
+    path = _as_path(path)
     with path.open('rb') as file:
         data = pickle.load(file)
     return data
@@ -162,8 +207,8 @@ def repath(current_path: PathType, new_path: PathType,
     Returns:
         New path.
     """
-    current_path = pathlib.Path(current_path)
-    new_path = pathlib.Path(new_path)
+    current_path = _as_path(current_path)
+    new_path = _as_path(new_path)
     if ext is None:
         new_path = new_path.joinpath(current_path.name)
     else:
@@ -179,9 +224,9 @@ def save_to_pickle(data: Any, path: PathType) -> None:
         data:  Pickleable object.
         path:  Path to save the file.
     """
-    path = pathlib.Path(path)
+    path = _as_path(path)
     with path.open('wb') as file:
-        pickle.dump(data, file)
+        pickle.dump(data, file, protocol=pickle.HIGHEST_PROTOCOL)
 
 
 def save_to_npy(data: Array, path: PathType) -> None:
@@ -191,7 +236,7 @@ def save_to_npy(data: Array, path: PathType) -> None:
         data:  Numpy array.
         path:  Path to save the file.
     """
-    path = pathlib.Path(path)
+    path = _as_path(path)
     with path.open('wb') as file:
         np.save(file, data, allow_pickle=False)
 
@@ -205,8 +250,37 @@ def load_from_npy(path: PathType) -> Array:
     Returns:
         Data as numpy array.
     """
-    path = pathlib.Path(path)
+    path = _as_path(path)
     with path.open('rb') as file:
         data = np.load(file, allow_pickle=False)
     return data
 
+
+def save_to_npz(data: Dict[str, Array], path: PathType,
+                compress: bool = True) -> None:
+    """Save multiple arrays to a numpy zip archive without using pickle.
+
+    Args:
+        data:      Mapping of array names to numpy arrays.
+        path:      Path to save the file.
+        compress:  If ``True``, deflate the archive members.
+    """
+    path = _as_path(path)
+    savez = np.savez_compressed if compress else np.savez
+    with path.open('wb') as file:
+        savez(file, **data)
+
+
+def load_from_npz(path: PathType) -> Dict[str, Array]:
+    """Load arrays from a numpy zip archive.
+
+    Args:
+        path:  File path.
+
+    Returns:
+        Mapping of array names to numpy arrays.
+    """
+    path = _as_path(path)
+    with np.load(path, allow_pickle=False) as archive:
+        data = dict(archive)
+    return data
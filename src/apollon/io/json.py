@@ -13,6 +13,7 @@ Functions:
     load
     validate_ndarray
 """
+import base64
 import json
 import pathlib
 import pkg_resources
@@ -21,6 +22,11 @@ from typing import Any, Union
 import jsonschema
 import numpy as np
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from .. import APOLLON_PATH
 from .. _defaults import SCHEMA_DIR_PATH, SCHEMA_EXT
 from .. types import Array, PathType
@@ -50,7 +56,7 @@ def load_schema(schema_name: str) -> dict:
     raise IOError(f'Schema ``{schema_path.name}`` not found.')
 
 
-def dump(obj: Any, path: PathType) -> None:
+def dump(obj: Any, path: PathType, fast: bool = False) -> None:
     """Write ``obj`` to JSON file.
 
     This function can handel numpy arrays.
@@ -58,13 +64,26 @@ def dump(obj: Any, path: PathType) -> None:
     If ``path`` is None, this fucntion writes to stdout.  Otherwise, encoded
     object is written to ``path``.
 
+    If ``fast`` is ``True`` and the ``orjson`` package is available, it is
+    used for encoding. Note that ``orjson`` differs from the standard
+    library encoder: non-finite floats are encoded as ``null``, integers
+    exceeding 64 bit raise a ``TypeError``, and dataclasses as well as
+    date and time objects are serialized.
+
     Args:
         obj:   Object to be encoded.
         path:  Output file path.
+        fast:  If ``True``, encode using ``orjson`` if available.
     """
     path = pathlib.Path(path)
-    with path.open('w') as json_file:
-        json.dump(obj, json_file, cls=ArrayEncoder)
+    if fast and orjson is not None:
+        blob = orjson.dumps(obj, default=_orjson_default,
+                            option=orjson.OPT_NON_STR_KEYS)
+        with path.open('wb') as json_file:
+            json_file.write(blob)
+    else:
+        with path.open('w') as json_file:
+            json.dump(obj, json_file, cls=ArrayEncoder)
 
 
 def load(path: PathType):
@@ -97,6 +116,9 @@ def validate_ndarray(encoded_arr: dict) -> bool:
 def decode_ndarray(instance: dict) -> Array:
     """Decode numerical numpy arrays from a JSON data stream.
 
+    Arrays encoded as nested list of elements, as written by previous
+    versions of ``encode_ndarray``, are decoded as well.
+
     Args:
         instance:  Instance of ``ndarray.schema.json``.
 
@@ -104,14 +126,17 @@ def decode_ndarray(instance: dict) -> Array:
         Numpy array.
     """
     _NDARRAY_VALIDATOR.validate(instance)
-    return np.array(instance['data'], dtype=instance['__dtype__'])
+    return _restore_ndarray(instance)
 
 
 def encode_ndarray(arr: Array) -> dict:
     """Transform an numpy array to a JSON-serializable dict.
 
     Array must have a numerical dtype. Datetime objects are currently
-    not supported.
+    not supported. The array elements are stored as base64-encoded raw
+    buffer in C order. Arrays of dtype ``object`` hold references, which
+    cannot be stored as raw buffer. They are encoded in the legacy format
+    as nested list of elements.
 
     Args:
         arr:  Numpy ndarray.
@@ -119,15 +144,38 @@ def encode_ndarray(arr: Array) -> dict:
     Returns:
         JSON-serializable dict adhering ``ndarray.schema.json``.
     """
+    if arr.dtype.hasobject:
+        return {'__ndarray__': True, '__dtype__': arr.dtype.str,
+                'data': arr.tolist()}
+    data = base64.b64encode(arr.tobytes())
     return {'__ndarray__': True, '__dtype__': arr.dtype.str,
-            'data': arr.tolist()}
+            '__shape__': list(arr.shape), 'data': data.decode('ascii')}
+
+
+def _orjson_default(inp: Any) -> Any:
+    if isinstance(inp, Array):
+        return encode_ndarray(inp)
+    if isinstance(inp, np.generic):
+        return inp.item()
+    raise TypeError(f'Object of type {type(inp).__name__} is not '
+                    'JSON serializable')
+
+
+def _restore_ndarray(instance: dict) -> Array:
+    if isinstance(instance['data'], list):
+        # legacy format without raw buffer
+        return np.array(instance['data'], dtype=instance['__dtype__'])
+    buffer = bytearray(base64.b64decode(instance['data']))
+    arr = np.frombuffer(buffer, dtype=instance['__dtype__'])
+    return arr.reshape(instance['__shape__'])
 
 
 def _ndarray_hook(inp: dict) -> Union[Array, dict]:
-    try:
-        return decode_ndarray(inp)
-    except jsonschema.ValidationError:
-        return inp
+    # Most objects in a JSON stream are not arrays. Reject them without
+    # running the validator, and avoid raising ValidationErrors.
+    if '__ndarray__' in inp and _NDARRAY_VALIDATOR.is_valid(inp):
+        return _restore_ndarray(inp)
+    return inp
 
 
 class ArrayEncoder(json.JSONEncoder):
@@ -139,8 +187,8 @@ class ArrayEncoder(json.JSONEncoder):
     Simply set the ``cls`` parameter of the dump method to this class.
     """
     def default(self, inp: Any) -> Any:
-        """Custon SON encoder for numpy arrays. Other types are passed
-        on to ``JSONEncoder.default``.
+        """Custon SON encoder for numpy arrays and scalars. Other types are
+        passed on to ``JSONEncoder.default``.
 
         Args:
             inp:  Object to encode.
@@ -150,6 +198,8 @@ class ArrayEncoder(json.JSONEncoder):
         """
         if isinstance(inp, Array):
             return encode_ndarray(inp)
+        if isinstance(inp, np.generic):
+            return inp.item()
         return json.JSONEncoder.default(self, inp)
 
 
@@ -13,10 +13,12 @@ Functions:
     peak_picking            Identify local peaks in time series.
     evaluate_onsets         Evaluation of onset detection results given ground truth.
 """
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from typing import Dict, Optional, Tuple, Type, TypeVar
 
 import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
 import pandas as pd
 import scipy.signal as _sps
 
@@ -24,7 +26,7 @@ from . container import Params
 from . io import io
 from . signal import features
 from . signal import tools as _ast
-from . signal.spectral import Stft, StftParams
+from . signal.spectral import StftSegments, StftParams
 from . import fractal as _fractal
 from . import segment as aseg
 from . types import Array, PathType
@@ -166,14 +168,13 @@ class EntropyOnsetDetector(OnsetDetector):
             Onset detection function.
         """
         segs = self.cutter.transform(inp)
-        odf = np.empty((segs.n_segs, 3))
-        for i, seg in enumerate(segs):
-            emb = _fractal.delay_embedding(seg.squeeze(), self.delay, self.m_dims)
-            odf[i, 0] = segs.center(i)
-            odf[i, 0] = odf[i, 0] / self.fps
-            odf[i, 2] = _fractal.embedding_entropy(emb, self.bins)
-        odf[i, 2] = np.maximum(odf[i, 2], odf[i, 2].mean())
-        return pd.DataFrame(data=odf, columns=['frame', 'time', 'value'])
+        embs = _fractal.delay_embedding(segs.data.T, self.delay, self.m_dims)
+        entropy = _fractal.batch_embedding_entropy(embs, self.bins)
+        frames = segs.center(0) + np.arange(segs.n_segs) * segs.step
+        odf = {'frame': frames,
+               'time': frames / self.fps,
+               'value': np.maximum(entropy, entropy.mean(), out=entropy)}
+        return pd.DataFrame(odf)
 
 
 class FluxOnsetDetector(OnsetDetector):
@@ -192,7 +193,9 @@ class FluxOnsetDetector(OnsetDetector):
             pp_params:  Keyword args for peak picking.
         """
         super().__init__()
-        self._stft = Stft(fps, window, n_perseg, n_overlap)
+        self.fps = fps
+        self.cutter = aseg.Segmentation(n_perseg, n_overlap)
+        self._stft = StftSegments(fps, window)
         if pp_params:
             self._ppkr = FilterPeakPicker(**pp_params)
         else:
@@ -207,14 +210,49 @@ class FluxOnsetDetector(OnsetDetector):
         Returns:
             Onset detection function.
         """
-        sxx = self._stft.transform(inp)
-        flux = features.spectral_flux(sxx.abs, total=True)
-        times = sxx.times.squeeze()
-        odf = {'frame': (times * sxx.params.fps).astype(int),
-               'time': times,
-               'value': np.maximum(flux.squeeze(), flux.mean())}
+        segs = self.cutter.transform(inp)
+        flux = self._blockwise_flux(segs)
+        frames = segs.center(0) + np.arange(segs.n_segs) * segs.step
+        odf = {'frame': frames,
+               'time': frames / self.fps,
+               'value': np.maximum(flux, flux.mean(), out=flux)}
         return pd.DataFrame(odf)
 
+    def _blockwise_flux(self, segs: aseg.Segments) -> Array:
+        """Compute the total spectral flux without materializing the
+        entire spectrogram.
+
+        Spectral flux depends on the neighbouring spectra. Hence, the last
+        two magnitude spectra of each block are carried over to the next
+        block, and the flux of a block's last spectrum is finalized there.
+
+        Args:
+            segs:  Segmented audio data.
+
+        Returns:
+            Spectral flux per segment.
+        """
+        out = np.empty(segs.n_segs)
+        buff = None
+        pos = 0
+        for bins in self._stft.iter_transform(segs):
+            n_cols = bins.shape[1]
+            if buff is None:
+                # first two columns hold the carry of the previous block
+                buff = np.empty((bins.shape[0], n_cols+2), order='F')
+                block = buff[:, 2:n_cols+2]
+                first = 0
+            else:
+                block = buff[:, :n_cols+2]
+                first = 1
+            np.absolute(bins, out=buff[:, 2:n_cols+2])
+            flux = features.spectral_flux(block, total=True)[0]
+            out[pos:pos+flux.size-first-1] = flux[first:-1]
+            pos += flux.size - first - 1
+            buff[:, :2] = block[:, -2:]
+        out[-1] = flux[-1]
+        return out
+
 
 class FilterPeakPicker:
     def __init__(self, n_after: int = 10, n_before: int = 10,
@@ -241,47 +279,67 @@ class FilterPeakPicker:
         Return:
             Peak indices.
         """
-        g = [0]
-        out = []
+        if inp.size == 0:
+            return np.array([], dtype=int)
 
-        for n, val in enumerate(inp):
-            # set local window
-            idx = np.arange(n-self.n_before, n+self.n_after+1, 1)
-            window = np.take(inp, idx, mode='clip')
+        # local windows, clipped at the boundaries of ``inp``
+        padded = np.pad(inp, (self.n_before, self.n_after), mode='edge')
+        windows = sliding_window_view(padded, self.n_before+self.n_after+1)
 
-            cond1 = np.all(val >= window)
-            cond2 = val >= (np.mean(window) + self.delta)
+        cond1 = inp >= windows.max(axis=1)
+        cond2 = inp >= windows.mean(axis=1) + self.delta
 
-            foo = max(val, self.alpha*g[n] + (1-self.alpha)*val)
-            g.append(foo)
-            cond3 = val >= foo
+        # adaptive threshold; only the previous value is needed
+        g_prev = 0.0
+        cond3 = np.empty(inp.size, dtype=bool)
+        for n, val in enumerate(inp.tolist()):
+            g_prev = max(val, self.alpha*g_prev + (1-self.alpha)*val)
+            cond3[n] = val >= g_prev
 
-            if cond1 and cond2 and cond3:
-                out.append(n)
-
-        return np.array(out)
+        return np.flatnonzero(cond1 & cond2 & cond3)
 
 
 def evaluate_onsets(targets: Dict[str, np.ndarray],
-                    estimates: Dict[str, np.ndarray]
+                    estimates: Dict[str, np.ndarray],
+                    max_workers: Optional[int] = 1
                     ) -> Tuple[float, float, float]:
     """Evaluate onset detection performance.
 
-    This function uses the mir_eval package for evaluation.
+    This function uses the mir_eval package for evaluation. By default,
+    files are evaluated one after another. If ``max_workers`` is not 1,
+    files are evaluated concurrently in a process pool, since mir_eval's
+    event matching is pure Python and holds the GIL. Starting the pool
+    takes time, so this only pays off for many files on several cores.
+
+    If processes are started with ``spawn`` or ``forkserver``, which is
+    the default on Windows and macOS, the calling script must guard its
+    entry point with ``if __name__ == '__main__':``.
 
     Params:
-        targets:    Ground truth onset times, with dict keys being file names,
-                    and values being target onset time codes in ms.
+        targets:      Ground truth onset times, with dict keys being file names,
+                      and values being target onset time codes in ms.
 
-        estimates:  Estimated onsets times, with dictkeys being file names,
-                    and values being the estimated onset time codes in ms.
+        estimates:    Estimated onsets times, with dictkeys being file names,
+                      and values being the estimated onset time codes in ms.
+
+        max_workers:  Maximum number of processes. If ``None``, the
+                      ``ProcessPoolExecutor`` default is used.
 
     Returns:
         Precison, recall, f-measure.
     """
-    out = []
-    for name, tvals in targets.items():
-        od_eval = _me.onset.evaluate(tvals, estimates[name])
-        out.append([i for i in od_eval.values()])
-
+    names = list(targets)
+    target_vals = [targets[name] for name in names]
+    estimate_vals = [estimates[name] for name in names]
+    if max_workers == 1 or len(names) < 2:
+        out = list(map(_evaluate_onsets, target_vals, estimate_vals))
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            out = list(pool.map(_evaluate_onsets, target_vals, estimate_vals))
     return np.array(out)
+
+
+def _evaluate_onsets(target: np.ndarray, estimate: np.ndarray) -> list:
+    """Evaluate a single file. Defined at module level to be picklable."""
+    import mir_eval as _me
+    return list(_me.onset.evaluate(target, estimate).values())
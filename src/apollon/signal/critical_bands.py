@@ -7,6 +7,7 @@ from scipy.signal.windows import get_window as _get_window
 
 from .. types import Array as _Array
 from .. import tools as _tools
+from .. import _defaults
 
 
 def frq2cbr(frq: _Array) -> _Array:
@@ -117,7 +118,7 @@ def sharpness(cbr_spctrm: _Array) -> _Array:
     Returns:
         (ndarray)    Sharpness for each time instant of the cbr_spctrm
     """
-    loud_specific = _np.maximum(specific_loudness(cbr_spctrm), _np.finfo('float64').eps)
+    loud_specific = _np.maximum(specific_loudness(cbr_spctrm), _defaults.FLOAT64_EPS)
     loud_total = _tools.fsum(loud_specific, keepdims=True)
 
     z = _np.arange(1, 25)
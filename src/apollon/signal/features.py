@@ -7,7 +7,6 @@ Audio feature extraction routines.
 """
 
 import numpy as _np
-from scipy.signal import hilbert as _hilbert
 from scipy.signal import correlate as SPcorrelate
 from typing import Optional
 
@@ -189,7 +188,9 @@ def spectral_centroid(frqs: _Array, amps: _Array) -> _Array:
         where :math:`f_i` is the center frequency, and :math:`p(i)` the
         relative amplitude of the :math:`i` th DFT bin.
     """
-    return tools.fsum(frqs*_power_distr(amps), axis=0, keepdims=True)
+    total = tools.fsum(amps, axis=0, keepdims=True)
+    total[total == 0] = 1
+    return (frqs.T @ amps) / total
 
 
 def spectral_spread(frqs: _Array, bins: _Array,
@@ -298,8 +299,9 @@ def spectral_flux(inp: _Array, delta: float = 1.0,
         where :math:`X_{i,j}` is the :math:`j` th frequency bin of the :math:`i`
         th spectrum :math:`X` of a spectrogram :math:`\boldsymbol X`.
     """
-    inp = _np.atleast_2d(inp).astype('float64')
-    out = _np.maximum(_np.gradient(inp, delta, axis=-1), 0)
+    inp = _np.atleast_2d(inp).astype('float64', copy=False)
+    out = _np.gradient(inp, delta, axis=-1)
+    _np.maximum(out, 0, out=out)
     if total:
         return out.sum(axis=0, keepdims=True)
     return out
@@ -377,7 +379,7 @@ def log_attack_time(inp: _Array, fps: int, ons_idx: _Array,
     """
     wlen = int(fps * wlen)
     segs = _segment.by_onsets(inp, wlen, ons_idx)
-    attack_time = _np.absolute(_hilbert(segs)).argmax(axis=1) / fps
+    attack_time = _envelope(segs).argmax(axis=1) / fps
     attack_time[attack_time == 0.0] = 1.0
     return _np.log(attack_time)
 
@@ -435,6 +437,31 @@ def sharpness(frqs: _Array, bins: _Array) -> _Array:
     return _cb.sharpness(cbrs)
 
 
+def _envelope(inp: _Array) -> _Array:
+    """Compute the magnitude of the analytic signal along the last axis.
+
+    This is equivalent to ``abs(scipy.signal.hilbert(inp))``. However, only
+    the imaginary part of the analytic signal is computed, using real-input
+    FFTs, which halves the transform sizes.
+
+    Args:
+        inp:  Real input array.
+
+    Returns:
+        Envelope of ``inp``.
+    """
+    n_inp = inp.shape[-1]
+    spctr = _np.fft.rfft(inp, axis=-1)
+    spctr *= -1j
+    spctr[..., 0] = 0
+    if n_inp % 2 == 0:
+        spctr[..., -1] = 0
+    out = _np.fft.irfft(spctr, n_inp, axis=-1)
+    out *= out
+    out += inp * inp
+    return _np.sqrt(out, out=out)
+
+
 def _power_distr(bins: _Array) -> _Array:
     """Computes the spectral energy distribution.
 
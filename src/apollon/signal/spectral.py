@@ -13,7 +13,8 @@ Classes:
 Functions:
     fft:  One-sided Fast fourier transform for real input.
 """
-from typing import Any, Union
+import functools
+from typing import Any, Generator, Union
 
 import matplotlib.pyplot as _plt
 import numpy as np
@@ -54,13 +55,34 @@ def fft(sig, window: str = None, n_fft: int = None,
     if window is None:
         window = 'rect'
 
-    win = np.expand_dims(_sps.get_window(window, n_sig), 1)
-    bins = np.fft.rfft(sig*win, n_fft, axis=0)
+    win = _window(window, n_sig, norm)
+    return np.fft.rfft(sig*win, n_fft, axis=0)
 
-    if norm:
-        bins = bins / np.sqrt(np.square(win.sum())) * 2
 
-    return bins
+@functools.lru_cache(maxsize=32)
+def _window(window: Union[str, tuple], n_sig: int, norm: bool) -> Array:
+    """Compute a window function as read-only column vector.
+
+    Results are cached, since ``fft`` is called repeatedly with the same
+    window, e.g., for each block of an STFT.
+
+    Args:
+        window:  Window specification. See ``scipy.signal.get_window``.
+        n_sig:   Window length in samples.
+        norm:    If True, scale the window such that a sinusodial signal
+                 with unit amplitude has unit amplitude in the spectrum.
+
+    Returns:
+        Window of shape (n_sig, 1).
+    """
+    win = _sps.get_window(window, n_sig)
+    if norm:
+        # The DFT is linear. Therefore, scaling the window is equivalent to
+        # scaling the bins, but saves two passes over the complex output.
+        win *= 2 / np.absolute(win.sum())
+    win = np.expand_dims(win, 1)
+    win.flags.writeable = False
+    return win
 
 
 class TransformResult:
@@ -68,10 +90,15 @@ class TransformResult:
     def __init__(self, params: Any, bins: np.ndarray) -> None:
         self._params = params
         self._bins = bins
+        self._abs: Optional[Array] = None
+        self._power: Optional[Array] = None
 
     @property
     def abs(self) -> Array:
-        """Compute magnitude spectrum."""
+        """Compute magnitude spectrum.
+
+        The result is computed once and cached as read-only array.
+        """
         return self.__abs__()
 
     @property
@@ -104,13 +131,22 @@ class TransformResult:
 
     @property
     def power(self):
-        """Compute power spectrum."""
-        return np.square(self.__abs__())
+        """Compute power spectrum.
+
+        The result is computed once and cached as read-only array.
+        """
+        if self._power is None:
+            self._power = np.square(self.__abs__())
+            self._power.flags.writeable = False
+        return self._power
 
     @property
     def centroid(self):
-        """Compute spectral centroid."""
-        return np.multiply(self.abs, self.frqs).sum() / self.abs.sum()
+        """Compute spectral centroid per column."""
+        mag = self.__abs__()
+        total = mag.sum(axis=0, keepdims=True)
+        total[total == 0] = 1.0
+        return (self.frqs.T @ mag) / total
 
     @property
     def _n_fft(self) -> int:
@@ -122,7 +158,10 @@ class TransformResult:
         return n_fft
 
     def __abs__(self) -> Array:
-        return np.absolute(self._bins)
+        if self._abs is None:
+            self._abs = np.absolute(self._bins)
+            self._abs.flags.writeable = False
+        return self._abs
 
     def __getitem__(self, key) -> Array:
         return self._bins[key]
@@ -275,3 +314,21 @@ class StftSegments(SpectralTransform):
             setattr(self.params, key, val)
         bins = fft(segments.data, self.params.window, self.params.n_fft)
         return Spectrogram(self.params, bins, segments.params.n_perseg)
+
+    def iter_transform(self, segments: Segments, n_segs: int = 128
+                       ) -> Generator[Array, None, None]:
+        """Transform ``segments`` to spectral domain block-wise.
+
+        Only the FFT bins of at most ``n_segs`` consecutive segments are
+        held in memory at once.
+
+        Args:
+            segments:  Segmented audio data.
+            n_segs:    Number of segments per block.
+
+        Yields:
+            FFT bins of consecutive segments.
+        """
+        for start in range(0, segments.n_segs, n_segs):
+            yield fft(segments[start:start+n_segs], self.params.window,
+                      self.params.n_fft)
@@ -24,6 +24,7 @@ Functions:
 
 import numpy as np
 from scipy import stats
+import scipy.signal as _sps
 
 from .. import _defaults
 from .. types import Array, Optional, Sequence, Union
@@ -33,6 +34,9 @@ def acf(inp: Array) -> Array:
     """Normalized estimate of the autocorrelation function of ``inp``
     by means of cross correlation.
 
+    The cross correlation is computed by ``scipy.signal.correlate``, which
+    switches to FFT-based correlation for long inputs.
+
     Args:
         inp:  One-dimensional input array.
 
@@ -41,17 +45,11 @@ def acf(inp: Array) -> Array:
     """
     N = len(inp)
     norm = inp @ inp
-    out = np.empty(N)
-    out[0] = 1
-    for lag in range(1, N):
-        pre = inp[:-lag]
-        post = inp[lag:]
-        prod = pre @ post
-        if prod == 0:
-            out[lag] = 0
-        else:
-            out[lag] = prod / norm
-    return out
+    if norm == 0:
+        out = np.zeros(N)
+        out[0] = 1
+        return out
+    return _sps.correlate(inp, inp, mode='full')[N-1:] / norm
 
 
 def acf_pearson(inp_sig):
@@ -76,7 +74,7 @@ def corr_coef_pearson(x_sig: Array, y_sig: Array) -> float:
     """Fast perason correlation coefficient."""
     x_dtr = x_sig - np.mean(x_sig)
     y_dtr = y_sig - np.mean(y_sig)
-    r_xy = np.convolve(x_dtr, y_dtr[::-1], mode='valid')
+    r_xy = x_dtr @ y_dtr
     r_xx_yy = (x_dtr @ x_dtr) * (y_dtr @ y_dtr)
     return r_xy / r_xx_yy
 
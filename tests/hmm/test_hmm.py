@@ -2,11 +2,15 @@
 Unit test for HMM implementation."""
 
 
+import pathlib
+import tempfile
+import unittest
+
 import numpy as np
 from scipy.stats import poisson
-import unittest
 
 from apollon.hmm.poisson import PoissonHmm
+from apollon.io.io import load_from_npz
 
 
 class TestHMM_utilities(unittest.TestCase):
@@ -33,6 +37,19 @@ class TestHMM_utilities(unittest.TestCase):
         hmm.fit(data)
         self.assertTrue(hmm.success)
 
+    def test_save_params(self):
+        data = np.concatenate([poisson(mu).rvs(30) for mu in (20, 80)])
+        hmm = PoissonHmm(data, 2)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = pathlib.Path(tmp, 'params.npz')
+            with self.assertRaises(ValueError):
+                hmm.save_params(path)
+            hmm.fit(data)
+            hmm.save_params(path)
+            params = load_from_npz(path)
+        for key, val in hmm.params.__dict__.items():
+            self.assertTrue(np.array_equal(params[key], val))
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,59 @@
+import pathlib
+import tempfile
+import unittest
+
+from apollon.io.io import WavFileAccessControl
+
+
+class _Owner:
+    file = WavFileAccessControl()
+
+
+class TestWavFileAccessControl(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = pathlib.Path(self.tmp.name, 'a.wav')
+        self.path.touch()
+        self.other = pathlib.Path(self.tmp.name, 'b.wav')
+        self.other.touch()
+        self.obj = _Owner()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_storage_key(self):
+        self.obj.file = self.path
+        self.assertEqual(self.obj.__dict__['_wav_file'], self.path.resolve())
+        self.assertEqual(self.obj.file, self.path.resolve())
+
+    def test_set_once(self):
+        self.obj.file = self.path
+        with self.assertRaises(AttributeError):
+            self.obj.file = self.other
+        self.assertEqual(self.obj.file, self.path.resolve())
+
+    def test_unset_raises(self):
+        with self.assertRaises(AttributeError):
+            self.obj.file
+
+    def test_class_access(self):
+        self.assertIsInstance(_Owner.file, WavFileAccessControl)
+
+    def test_delete_and_reassign(self):
+        self.obj.file = self.path
+        del self.obj.file
+        with self.assertRaises(AttributeError):
+            self.obj.file
+        self.obj.file = self.other
+        self.assertEqual(self.obj.file, self.other.resolve())
+
+    def test_instances_are_independent(self):
+        other_obj = _Owner()
+        self.obj.file = self.path
+        other_obj.file = self.other
+        self.assertEqual(self.obj.file, self.path.resolve())
+        self.assertEqual(other_obj.file, self.other.resolve())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,7 +1,15 @@
 import json
+import tempfile
 import unittest
+from unittest import mock
 
-from apollon.io.json import load_schema
+from hypothesis import given
+import hypothesis.extra.numpy as htn
+import numpy as np
+
+import apollon.io.json as aj
+from apollon.io.json import (load_schema, decode_ndarray, encode_ndarray,
+                             dump, load)
 
 class TestLoadSchema(unittest.TestCase):
     def setUp(self):
@@ -10,3 +18,99 @@ class TestLoadSchema(unittest.TestCase):
     def test_load(self):
         schema = load_schema('ndarray')
         self.assertTrue(isinstance(schema, dict))
+
+
+class TestEncodeNdarray(unittest.TestCase):
+    def test_encoding(self):
+        encoded = encode_ndarray(np.arange(10.0).reshape(2, 5))
+        self.assertTrue(encoded['__ndarray__'])
+        self.assertTrue(isinstance(encoded['__dtype__'], str))
+        self.assertEqual(encoded['__shape__'], [2, 5])
+        self.assertTrue(isinstance(encoded['data'], str))
+
+
+class TestDecodeLegacyNdarray(unittest.TestCase):
+    def setUp(self):
+        self.legacy = {'__ndarray__': True, '__dtype__': '<i8',
+                       'data': [[1, 2, 3], [4, 5, 6]]}
+
+    def test_decode(self):
+        arr = decode_ndarray(self.legacy)
+        self.assertEqual(arr.dtype, np.dtype('<i8'))
+        self.assertTrue(np.array_equal(arr, self.legacy['data']))
+
+    def test_load(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = tmp + '/legacy.json'
+            with open(path, 'w') as fobj:
+                json.dump({'arr': self.legacy}, fobj)
+            restored = load(path)
+        self.assertTrue(isinstance(restored['arr'], np.ndarray))
+        self.assertTrue(np.array_equal(restored['arr'], self.legacy['data']))
+
+
+class TestNdarrayRoundTrip(unittest.TestCase):
+    @given(htn.arrays(htn.floating_dtypes() | htn.integer_dtypes(),
+                      htn.array_shapes(min_dims=0)))
+    def test_round_trip(self, arr):
+        encoded = json.loads(json.dumps(encode_ndarray(arr)))
+        restored = decode_ndarray(encoded)
+        self.assertEqual(arr.dtype, restored.dtype)
+        self.assertEqual(arr.shape, restored.shape)
+        self.assertTrue(np.array_equal(arr, restored, equal_nan=True))
+
+    def test_object_dtype(self):
+        arr = np.array([1, 'a', 2.5], dtype=object)
+        encoded = json.loads(json.dumps(encode_ndarray(arr)))
+        restored = decode_ndarray(encoded)
+        self.assertEqual(restored.dtype, arr.dtype)
+        self.assertEqual(restored.tolist(), arr.tolist())
+
+    def test_non_contiguous(self):
+        arr = np.arange(20.0).reshape(4, 5).T
+        restored = decode_ndarray(encode_ndarray(arr))
+        self.assertTrue(np.array_equal(arr, restored))
+        self.assertTrue(restored.flags.writeable)
+
+
+class TestDumpLoad(unittest.TestCase):
+    def test_mixed_objects(self):
+        obj = {'arr': np.arange(10.0), 'meta': {'name': 'x', 'n': 2},
+               'items': [{'a': 1}, {'b': np.ones((2, 3), dtype='int16')}]}
+        with tempfile.TemporaryDirectory() as tmp:
+            path = tmp + '/obj.json'
+            dump(obj, path)
+            restored = load(path)
+        self.assertTrue(np.array_equal(restored['arr'], obj['arr']))
+        self.assertEqual(restored['meta'], obj['meta'])
+        self.assertEqual(restored['items'][0], {'a': 1})
+        self.assertTrue(np.array_equal(restored['items'][1]['b'],
+                                       obj['items'][1]['b']))
+
+    def test_default_ignores_orjson(self):
+        obj = {'arr': np.arange(4.0), 'scalars': [np.float32(.5), np.int64(3)],
+               'special': [np.nan, np.inf, -np.inf, 2**70]}
+        with tempfile.TemporaryDirectory() as tmp:
+            dump(obj, tmp + '/default.json')
+            with mock.patch.object(aj, 'orjson', None):
+                dump(obj, tmp + '/stdlib.json')
+            with open(tmp + '/default.json') as fobj:
+                default = fobj.read()
+            with open(tmp + '/stdlib.json') as fobj:
+                stdlib = fobj.read()
+            restored = load(tmp + '/default.json')
+        self.assertEqual(default, stdlib)
+        self.assertTrue(np.isnan(restored['special'][0]))
+        self.assertEqual(restored['special'][1:], [np.inf, -np.inf, 2**70])
+
+    @unittest.skipIf(aj.orjson is None, 'orjson not installed')
+    def test_encoders_agree(self):
+        obj = {'arr': np.arange(4.0), 'scalars': [np.float32(.5), np.int64(3)]}
+        with tempfile.TemporaryDirectory() as tmp:
+            dump(obj, tmp + '/fast.json', fast=True)
+            dump(obj, tmp + '/stdlib.json')
+            with open(tmp + '/fast.json') as fobj:
+                fast = json.load(fobj)
+            with open(tmp + '/stdlib.json') as fobj:
+                stdlib = json.load(fobj)
+        self.assertEqual(fast, stdlib)
@@ -0,0 +1,34 @@
+import pathlib
+import tempfile
+import unittest
+
+import numpy as np
+
+from apollon.io.io import load_from_npz, save_to_npz
+
+
+class TestNpzRoundTrip(unittest.TestCase):
+    def setUp(self):
+        self.data = {'lambda_': np.random.rand(3),
+                     'gamma_': np.random.rand(3, 3),
+                     'delta_': np.arange(3, dtype='int32')}
+
+    def assert_round_trip(self, compress):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = pathlib.Path(tmp, 'data.npz')
+            save_to_npz(self.data, path, compress=compress)
+            restored = load_from_npz(str(path))
+        self.assertEqual(restored.keys(), self.data.keys())
+        for key, val in self.data.items():
+            self.assertEqual(restored[key].dtype, val.dtype)
+            self.assertTrue(np.array_equal(restored[key], val))
+
+    def test_compressed(self):
+        self.assert_round_trip(True)
+
+    def test_uncompressed(self):
+        self.assert_round_trip(False)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,54 @@
+import os
+import pathlib
+import tempfile
+import unittest
+
+from apollon.io.io import generate_outpath
+
+
+class TestGenerateOutpath(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.dir = pathlib.Path(self.tmp.name)
+        self.in_path = 'audio/beat.wav'
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_out_path_none(self):
+        self.assertEqual(generate_outpath(self.in_path, None),
+                         pathlib.Path('beat'))
+        self.assertEqual(generate_outpath(self.in_path, None, 'json'),
+                         pathlib.Path('beat.json'))
+
+    def test_out_path_dir(self):
+        res = generate_outpath(self.in_path, str(self.dir), 'json')
+        self.assertEqual(res, self.dir.joinpath('beat.json'))
+        res = generate_outpath(self.in_path, str(self.dir) + os.sep, 'json')
+        self.assertEqual(res, self.dir.joinpath('beat.json'))
+
+    def test_out_path_file(self):
+        out = self.dir.joinpath('features.json')
+        self.assertEqual(generate_outpath(self.in_path, str(out), 'csv'), out)
+
+    def test_missing_parent(self):
+        with self.assertRaises(ValueError):
+            generate_outpath(self.in_path, self.dir.joinpath('x', 'f.json'))
+        with self.assertRaises(ValueError):
+            generate_outpath(self.in_path, self.dir.joinpath('x'))
+
+    def test_trailing_dot_is_dir(self):
+        with self.assertRaises(ValueError):
+            generate_outpath(self.in_path, self.dir.joinpath('a.'))
+        os.mkdir(self.dir.joinpath('a.'))
+        res = generate_outpath(self.in_path, self.dir.joinpath('a.'), 'json')
+        self.assertEqual(res, self.dir.joinpath('a.', 'beat.json'))
+
+    def test_path_inputs(self):
+        res = generate_outpath(pathlib.Path(self.in_path), self.dir, 'json')
+        self.assertIsInstance(res, pathlib.Path)
+        self.assertEqual(res, self.dir.joinpath('beat.json'))
+
+
+if __name__ == '__main__':
+    unittest.main()
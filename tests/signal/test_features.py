@@ -1,5 +1,6 @@
 import unittest
 import numpy as np
+from scipy.signal import hilbert
 
 from hypothesis import given, assume
 from hypothesis import strategies as st
@@ -92,5 +93,13 @@ class TestSpectralSpread(unittest.TestCase):
        self.assertLess(sps.item(), 1.0)
 
 
+class TestEnvelope(unittest.TestCase):
+    @given(htn.arrays(np.float64, htn.array_shapes(min_dims=2, max_dims=2),
+                      elements=st.floats(-1, 1)))
+    def test_equals_hilbert_magnitude(self, inp):
+        expected = np.absolute(hilbert(inp))
+        self.assertTrue(np.allclose(features._envelope(inp), expected))
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -6,6 +6,7 @@ from hypothesis import given
 from hypothesis.strategies import integers, floats
 from hypothesis.extra.numpy import arrays, array_shapes
 
+from apollon.segment import Segmentation
 from apollon.signal.spectral import fft, Dft, Stft, StftSegments
 from apollon.signal.container import StftParams
 from apollon.signal.tools import sinusoid
@@ -178,6 +179,33 @@ class TestSpectrogram(unittest.TestCase):
         sxx = stft.transform(sig)
         self.assertEqual(sxx.frqs.shape[0], sxx.bins.shape[0])
 
+    def test_centroid_per_segment(self) -> None:
+        fps = 9000
+        sig = sinusoid(1000, fps=fps)
+        stft = Stft(fps, **TestSpectrogram.ap_args)
+        sxx = stft.transform(sig)
+        cntr = sxx.centroid
+        self.assertEqual(cntr.shape, (1, sxx.n_segments))
+        self.assertTrue(np.allclose(cntr[0, 2:-2], 1000, rtol=0.05))
+
+    def test_iter_transform_equals_transform(self) -> None:
+        fps = 9000
+        sig = np.random.rand(fps, 1)
+        segs = Segmentation(512, 256).transform(sig)
+        stft = StftSegments(fps, 'hamming')
+        blocks = list(stft.iter_transform(segs, n_segs=10))
+        self.assertTrue(all(block.shape[1] <= 10 for block in blocks))
+        self.assertTrue(np.allclose(np.hstack(blocks),
+                                    stft.transform(segs).bins))
+
+    def test_magnitude_is_cached(self) -> None:
+        sig = np.random.rand(9000, 1)
+        stft = Stft(9000, **TestSpectrogram.ap_args)
+        sxx = stft.transform(sig)
+        self.assertIs(sxx.abs, sxx.abs)
+        self.assertFalse(sxx.abs.flags.writeable)
+        self.assertTrue(np.allclose(sxx.power, np.absolute(sxx.bins)**2))
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -24,6 +24,23 @@ class TestAmp(unittest.TestCase):
         self.assertTrue(cnd)
 
 
+class TestAcf(unittest.TestCase):
+    def setUp(self):
+        self.data = np.random.randn(500)
+
+    def test_matches_lagged_products(self):
+        res = tools.acf(self.data)
+        norm = self.data @ self.data
+        expected = [1.0] + [self.data[:-lag] @ self.data[lag:] / norm
+                            for lag in range(1, self.data.size)]
+        self.assertTrue(np.allclose(res, expected))
+
+    def test_zero_input(self):
+        res = tools.acf(np.zeros(10))
+        self.assertEqual(res[0], 1.0)
+        self.assertTrue(np.all(res[1:] == 0))
+
+
 class TestSinusoid(unittest.TestCase):
     def setUp(self):
         self.single_frq = 100
@@ -0,0 +1,53 @@
+"""test_fractal.py
+"""
+import unittest
+
+from hypothesis import given
+from hypothesis.strategies import integers
+import numpy as np
+
+from apollon import fractal
+
+
+class TestDelayEmbedding(unittest.TestCase):
+    def setUp(self):
+        self.data = np.random.rand(4, 300)
+
+    def test_vectors(self):
+        emb = fractal.delay_embedding(self.data[0], 10, 3)
+        self.assertEqual(emb.shape, (280, 3))
+        self.assertTrue(np.array_equal(emb[5], self.data[0, 5:35:10]))
+
+    def test_batch(self):
+        embs = fractal.delay_embedding(self.data, 10, 3)
+        self.assertEqual(embs.shape, (4, 280, 3))
+        for seg, emb in zip(self.data, embs):
+            self.assertTrue(np.array_equal(
+                emb, fractal.delay_embedding(seg, 10, 3)))
+
+
+class TestBatchEmbeddingEntropy(unittest.TestCase):
+    def setUp(self):
+        self.embs = np.random.randint(-10, 10, (5, 200, 3)).astype(float)
+
+    @given(integers(min_value=1, max_value=20))
+    def test_equals_embedding_entropy(self, n_bins):
+        expected = [fractal.embedding_entropy(emb, n_bins)
+                    for emb in self.embs]
+        res = fractal.batch_embedding_entropy(self.embs, n_bins)
+        self.assertTrue(np.allclose(res, expected))
+
+    def test_blocked_equals_single_batch(self):
+        single = fractal.batch_embedding_entropy(self.embs, 10,
+                                                 n_block=len(self.embs))
+        for n_block in (1, 2, 3):
+            res = fractal.batch_embedding_entropy(self.embs, 10, n_block)
+            self.assertTrue(np.array_equal(res, single))
+
+    def test_constant_embedding(self):
+        res = fractal.batch_embedding_entropy(np.ones((2, 100, 3)), 10)
+        self.assertTrue(np.allclose(res, 0.0))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,11 +1,15 @@
+import importlib.util
 import unittest
+from unittest import mock
 
 import numpy as np
 import pandas as pd
 
 from apollon.audio import AudioFile
 from apollon.onsets import (OnsetDetector, EntropyOnsetDetector,
-        FluxOnsetDetector, FilterPeakPicker)
+        FluxOnsetDetector, FilterPeakPicker, evaluate_onsets)
+from apollon.signal import features
+from apollon.signal.spectral import Stft
 
 
 class TestOnsetDetector(unittest.TestCase):
@@ -50,6 +54,14 @@ class TestFluxOnsetDetector(unittest.TestCase):
         self.osd.detect(self.snd.data)
         self.assertIsInstance(self.osd.odf, pd.DataFrame)
 
+    def test_odf_equals_spectrogram_flux(self):
+        self.osd.detect(self.snd.data)
+        sxx = Stft(self.snd.fps, 'hamming', 1024, 512).transform(self.snd.data)
+        flux = features.spectral_flux(sxx.abs, total=True).squeeze()
+        self.assertTrue(np.allclose(self.osd.odf['time'], sxx.times))
+        self.assertTrue(np.allclose(self.osd.odf['value'],
+                                    np.maximum(flux, flux.mean())))
+
 
 class TestPeakPicking(unittest.TestCase):
     def setUp(self):
@@ -59,3 +71,57 @@ class TestPeakPicking(unittest.TestCase):
     def test_peaks(self):
         peaks = self.picker.detect(self.data)
         self.assertIsInstance(peaks, np.ndarray)
+
+    def test_empty_input(self):
+        peaks = self.picker.detect(np.array([]))
+        self.assertEqual(peaks.size, 0)
+
+    def test_equals_reference(self):
+        tied = np.random.randint(0, 4, 300).astype(float)
+        tied[100:110] = 10.0
+        for inp in (self.data, tied, np.zeros(50)):
+            for picker in (self.picker, FilterPeakPicker(3, 5, .5, 0.)):
+                self.assertTrue(np.array_equal(picker.detect(inp),
+                                               _reference_peaks(picker, inp)))
+
+
+def _reference_peaks(picker, inp):
+    g_prev = 0
+    out = []
+    for n, val in enumerate(inp):
+        idx = np.arange(n-picker.n_before, n+picker.n_after+1, 1)
+        window = np.take(inp, idx, mode='clip')
+        g_prev = max(val, picker.alpha*g_prev + (1-picker.alpha)*val)
+        if (np.all(val >= window) and val >= np.mean(window) + picker.delta
+                and val >= g_prev):
+            out.append(n)
+    return np.array(out, dtype=int)
+
+
+@unittest.skipIf(importlib.util.find_spec('mir_eval') is None,
+                 'mir_eval not installed')
+class TestEvaluateOnsets(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(1)
+        self.targets = {f'file{i}': np.sort(rng.uniform(0, 30, 50))
+                        for i in range(5)}
+        self.estimates = {name: np.sort(val + rng.normal(0, .05, val.size))
+                          for name, val in self.targets.items()}
+
+    def test_equals_serial(self):
+        import mir_eval
+        expected = [list(mir_eval.onset.evaluate(self.targets[name],
+                                                 self.estimates[name]).values())
+                    for name in self.targets]
+        for max_workers in (1, 2):
+            res = evaluate_onsets(self.targets, self.estimates, max_workers)
+            self.assertEqual(res.shape, (5, 3))
+            self.assertTrue(np.array_equal(res, expected))
+
+    def test_single_file(self):
+        name = next(iter(self.targets))
+        with mock.patch('apollon.onsets.ProcessPoolExecutor') as pool:
+            res = evaluate_onsets({name: self.targets[name]},
+                                  {name: self.estimates[name]}, None)
+        pool.assert_not_called()
+        self.assertEqual(res.shape, (1, 3))